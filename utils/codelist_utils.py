@@ -1,7 +1,23 @@
+import numpy as np
 import pandas as pd
 import requests
+import filecmp
+import itertools
+import json
 import os
-from typing import Dict
+import pickle
+import re
+from typing import Dict, Iterator, Optional, Union
+
+# Shared keep-alive session used by Codelists instances that are not given one
+_SESSION = requests.Session()
+
+# Cached RA list files already revalidated (or found unreachable) in this
+# process; later Codelists instances use them without another request
+_REVALIDATED_RA_LISTS = set()
+
+# Matches the "Registration Authority Code" column header
+_RA_CODE_RE = re.compile(r"registration.*authority.*code", re.I)
 
 
 class Codelists:
@@ -10,46 +26,118 @@ class Codelists:
     to dataframes.
     """
 
-    def __init__(self, cache_dir: str = "./cache"):
+    # Name fields concatenated (in this order) into the registration authority name
+    RA_NAME_COLUMNS = (
+        "International name of Register",
+        "International name of organisation responsible for the Register",
+        "Local name of organisation responsible for the Register",
+    )
+
+    def __init__(
+        self, cache_dir: str = "./cache", session: Optional[requests.Session] = None
+    ):
         """
         Initialize the Codelists class.
 
         Args:
             cache_dir: Directory to cache downloaded files
+            session: Optional requests session to reuse for downloads
         """
         self.cache_dir = cache_dir
+        self.session = session if session is not None else _SESSION
         os.makedirs(cache_dir, exist_ok=True)
+        self._ra_list_file = os.path.join(cache_dir, "ra-list-v1.8.1.csv")
+        self._ra_headers_file = os.path.join(cache_dir, "ra-list-v1.8.1.headers.json")
+        self._ra_mapping_file = os.path.join(cache_dir, "ra-mapping-v1.8.1.pkl")
         self._ra_mapping = None
+        self._ra_name_series = None
 
-    def _download_ra_list(self) -> pd.DataFrame:
+    def _download_ra_list(self) -> str:
         """
         Download the GLEIF Registration Authorities list from the GLEIF website.
 
+        A cached copy is revalidated with a conditional GET (ETag /
+        Last-Modified), so the body is only downloaded again when it changed.
+        This happens at most once per process; if revalidation fails, the
+        cached copy is used.
+
         Returns:
-            DataFrame with registration authority codelist
+            Path to the cached registration authority codelist CSV
         """
         url = "https://www.gleif.org/lei-data/code-lists/gleif-registration-authorities-list/2024-11-20_ra-list-v1.8.1.csv"
-        cache_file = os.path.join(self.cache_dir, "ra-list-v1.8.1.csv")
+        cache_file = self._ra_list_file
+        is_cached = os.path.exists(cache_file)
+        if is_cached and cache_file in _REVALIDATED_RA_LISTS:
+            return cache_file
 
-        # Check if file is already cached
-        if os.path.exists(cache_file):
-            return pd.read_csv(cache_file, encoding="utf-8")
+        # Send the validators from the last download, if any
+        headers = {}
+        if is_cached:
+            validators = self._load_ra_list_validators()
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
 
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            with self.session.get(
+                url, headers=headers, stream=True, timeout=30
+            ) as response:
+                if response.status_code == 304 and is_cached:
+                    _REVALIDATED_RA_LISTS.add(cache_file)
+                    return cache_file
+                response.raise_for_status()
+
+                # Stream the raw bytes to a temporary file (no decode/encode
+                # round trip through str)
+                part_file = cache_file + ".part"
+                with open(part_file, "wb") as f:
+                    for chunk in response.iter_content(64 * 1024):
+                        f.write(chunk)
 
-            # Save to cache with UTF-8 encoding
-            with open(cache_file, "w", encoding="utf-8") as f:
-                f.write(response.text)
+            # Replace the cache, leaving an unchanged file (and so the pickled
+            # mapping built from it) untouched
+            if is_cached and filecmp.cmp(part_file, cache_file, shallow=False):
+                os.remove(part_file)
+            else:
+                os.replace(part_file, cache_file)
+                print(
+                    "Registration authorities list downloaded and cached successfully"
+                )
 
-            print("Registration authorities list downloaded and cached successfully")
-            return pd.read_csv(cache_file, encoding="utf-8")
+            self._save_ra_list_validators(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            )
+            _REVALIDATED_RA_LISTS.add(cache_file)
+            return cache_file
 
         except Exception as e:
+            if is_cached:
+                _REVALIDATED_RA_LISTS.add(cache_file)
+                print(
+                    "Could not revalidate registration authorities list, "
+                    f"using cached copy: {e}"
+                )
+                return cache_file
             print(f"Error downloading registration authorities list: {e}")
             raise
 
+    def _load_ra_list_validators(self) -> Dict[str, Optional[str]]:
+        """Load the ETag / Last-Modified stored with the cached RA list."""
+        try:
+            with open(self._ra_headers_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_ra_list_validators(self, validators: Dict[str, Optional[str]]) -> None:
+        """Store the ETag / Last-Modified of the cached RA list."""
+        with open(self._ra_headers_file, "w", encoding="utf-8") as f:
+            json.dump(validators, f)
+
     def _create_ra_mapping(self) -> Dict[str, str]:
         """
         Create a mapping from Registration Authority Code to any available name.
@@ -60,114 +148,172 @@ class Codelists:
         if self._ra_mapping is not None:
             return self._ra_mapping
 
-        df = self._download_ra_list()
+        ra_list_file = self._download_ra_list()
 
-        # Create concatenated name combining the three required fields
-        def create_concatenated_name(row):
-            parts = []
-
-            # International name of Register
-            if (
-                pd.notna(row.get("International name of Register"))
-                and row.get("International name of Register").strip()
-            ):
-                parts.append(str(row.get("International name of Register")).strip())
-
-            # International name of organisation responsible for the Register
-            if (
-                pd.notna(
-                    row.get(
-                        "International name of organisation responsible for the Register"
-                    )
-                )
-                and row.get(
-                    "International name of organisation responsible for the Register"
-                ).strip()
-            ):
-                parts.append(
-                    str(
-                        row.get(
-                            "International name of organisation responsible for the Register"
-                        )
-                    ).strip()
-                )
-
-            # Local name of organisation responsible for the Register
-            if (
-                pd.notna(
-                    row.get("Local name of organisation responsible for the Register")
-                )
-                and row.get(
-                    "Local name of organisation responsible for the Register"
-                ).strip()
-            ):
-                parts.append(
-                    str(
-                        row.get(
-                            "Local name of organisation responsible for the Register"
-                        )
-                    ).strip()
-                )
+        # Reuse the mapping built on a previous run if it is newer than the CSV
+        cached_mapping = self._load_cached_ra_mapping()
+        if cached_mapping is not None:
+            self._ra_mapping = cached_mapping
+            return self._ra_mapping
 
-            # Join with " | " separator if multiple parts exist
-            return " | ".join(parts) if parts else None
+        df = pd.read_csv(ra_list_file, encoding="utf-8")
 
         # Find the correct column name for Registration Authority Code
-        ra_code_col = None
-        for col in df.columns:
-            if (
-                "registration" in col.lower()
-                and "authority" in col.lower()
-                and "code" in col.lower()
-            ):
-                ra_code_col = col
-                break
+        ra_code_col = next(
+            (col for col in df.columns if _RA_CODE_RE.search(col)), None
+        )
 
         if ra_code_col is None:
             raise ValueError(
                 f"Could not find Registration Authority Code column. Available columns: {list(df.columns)}"
             )
 
-        # Create the mapping
-        self._ra_mapping = {}
-        for _, row in df.iterrows():
-            ra_code = row.get(ra_code_col)
-            if pd.notna(ra_code):
-                self._ra_mapping[str(ra_code)] = create_concatenated_name(row)
+        # Create concatenated name combining the three required fields,
+        # joined with " | " and skipping missing or blank parts
+        names = pd.Series(pd.NA, index=df.index, dtype="string")
+        for col in self.RA_NAME_COLUMNS:
+            if col not in df.columns:
+                continue
+            part = df[col].astype("string").str.strip()
+            part = part.where(part != "")
+            names = (names + " | " + part).fillna(names).fillna(part)
+
+        # Create the mapping, skipping rows without an RA code
+        has_code = df[ra_code_col].notna()
+        names = names[has_code].astype(object)
+        self._ra_mapping = dict(
+            zip(
+                df.loc[has_code, ra_code_col].astype(str),
+                names.where(names.notna(), None),
+            )
+        )
+
+        self._save_cached_ra_mapping(self._ra_mapping)
 
         return self._ra_mapping
 
-    def addRegistrationauthorityName(self, ra_codes_column) -> pd.DataFrame:
+    def _load_cached_ra_mapping(self) -> Optional[Dict[str, str]]:
+        """
+        Load the RA mapping pickled by a previous run.
+
+        Returns:
+            The cached mapping, or None if it is missing, older than the cached
+            CSV or unreadable
+        """
+        if not (
+            os.path.exists(self._ra_mapping_file)
+            and os.path.exists(self._ra_list_file)
+        ):
+            return None
+
+        if os.path.getmtime(self._ra_mapping_file) < os.path.getmtime(
+            self._ra_list_file
+        ):
+            return None
+
+        try:
+            with open(self._ra_mapping_file, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable RA mapping cache: {e}")
+            return None
+
+    def _save_cached_ra_mapping(self, ra_mapping: Dict[str, str]) -> None:
+        """
+        Pickle the RA mapping next to the cached CSV so later runs can skip
+        parsing the CSV.
+        """
+        try:
+            with open(self._ra_mapping_file, "wb") as f:
+                pickle.dump(ra_mapping, f, protocol=5)
+        except OSError as e:
+            print(f"Could not cache RA mapping: {e}")
+
+    def addRegistrationauthorityName(
+        self, ra_codes_column, code_column: Optional[str] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Add registration authority names based on Registration Authority codes.
 
         Args:
-            ra_codes_column: Pandas Series, list, or array containing Registration Authority codes
+            ra_codes_column: Pandas Series, list, or array containing Registration Authority codes,
+                or an iterator of Series / DataFrame chunks (e.g. from
+                GoldenCopyDownload.iter_csv_chunks)
+            code_column: Column holding the RA codes in DataFrame chunks; may be
+                omitted for single-column chunks
 
         Returns:
-            DataFrame with original RA codes column and added 'registration_authority_name' column
+            DataFrame with original RA codes column and added 'registration_authority_name' column,
+            or, for an iterator of chunks, an iterator yielding one such DataFrame per chunk
+        """
+        if isinstance(ra_codes_column, Iterator):
+            # Only an iterator of Series / DataFrames is processed chunk by
+            # chunk; an iterator of codes is one column, as before
+            head = list(itertools.islice(ra_codes_column, 1))
+            ra_codes_column = itertools.chain(head, ra_codes_column)
+            if head and isinstance(head[0], (pd.Series, pd.DataFrame)):
+                return (
+                    self._add_ra_names(chunk, code_column)
+                    for chunk in ra_codes_column
+                )
+            ra_codes_column = list(ra_codes_column)
+        return self._add_ra_names(ra_codes_column, code_column)
+
+    def _add_ra_names(
+        self, ra_codes_column, code_column: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Build the code/name DataFrame for one batch of Registration Authority codes.
         """
+        # Take the code column out of a DataFrame chunk
+        if isinstance(ra_codes_column, pd.DataFrame):
+            if code_column is None:
+                if len(ra_codes_column.columns) != 1:
+                    raise ValueError(
+                        "code_column is required for DataFrames with more than one "
+                        f"column. Available columns: {list(ra_codes_column.columns)}"
+                    )
+                code_column = ra_codes_column.columns[0]
+            ra_codes_column = ra_codes_column[code_column]
+
         # Convert input to pandas Series if it isn't already
         if not isinstance(ra_codes_column, pd.Series):
             ra_codes_column = pd.Series(ra_codes_column)
 
-        # Get the RA mapping
-        ra_mapping = self._create_ra_mapping()
-
         # Create result DataFrame with original column (reset index to avoid showing index numbers)
         df_result = pd.DataFrame(
             {"registration_authority_code": ra_codes_column},
             index=ra_codes_column.index,
         ).reset_index(drop=True)
 
-        # Map the registration authority codes to names
-        df_result["registration_authority_name"] = df_result[
-            "registration_authority_code"
-        ].map(ra_mapping)
+        # Factorize the raw codes so that string conversion and name lookup
+        # happen once per distinct code (a few thousand at most) rather than
+        # once per row; missing codes get code -1
+        codes, uniques = pd.factorize(df_result["registration_authority_code"])
+        unique_names = (
+            self._ra_names()
+            .reindex(pd.Index(uniques).astype("string"), fill_value="")
+            .fillna("")
+            .to_numpy(dtype=object)
+        )
 
-        # Replace NaN values with empty strings for cleaner output
-        df_result["registration_authority_name"] = df_result[
-            "registration_authority_name"
-        ].fillna("")
+        # Fan the names out by code; code -1 picks up the trailing empty
+        # string for cleaner output
+        unique_names = np.append(unique_names, "")
+        df_result["registration_authority_name"] = unique_names[codes]
 
         return df_result.reset_index(drop=True)
+
+    def _ra_names(self) -> pd.Series:
+        """
+        Return the RA mapping as a Series of names indexed by RA code, built once
+        and cached for lookups against RA code columns.
+        """
+        if self._ra_name_series is None:
+            ra_mapping = self._create_ra_mapping()
+            self._ra_name_series = pd.Series(
+                list(ra_mapping.values()),
+                index=pd.Index(list(ra_mapping), dtype="string"),
+                dtype="string",
+            )
+        return self._ra_name_series
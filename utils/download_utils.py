@@ -1,13 +1,187 @@
+import csv
+import hashlib
+import json
+import itertools
 import os
+import queue
 import re
+import tempfile
+import threading
 import zipfile
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from urllib.parse import urlsplit, urlunsplit
-from typing import Optional, List, Union
+from typing import Iterator, Optional, List, Union
 import io
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional, only needed for use_arrow=True
+    pa = None
+    pa_csv = None
+
+
+def _sha256(path: str) -> str:
+    """Return the hex SHA-256 digest of a file, read in 1 MiB blocks."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python >= 3.11
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+        return digest.hexdigest()
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("use_arrow=True requires the optional 'pyarrow' package")
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only binary file object over an iterator of bytes chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        # Fill b completely (unless the chunks run out): pyarrow treats every
+        # read as a parse block and rejects rows spanning more than two blocks,
+        # so short transport chunks must not turn into short reads
+        view = memoryview(b).cast("B")
+        n = 0
+        while n < len(view):
+            if not self._buffer:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer = chunk
+                continue
+            take = min(len(view) - n, len(self._buffer))
+            view[n : n + take] = self._buffer[:take]
+            self._buffer = self._buffer[take:]
+            n += take
+        return n
+
+
+def _prefetch(chunks, maxsize: int = 16):
+    """
+    Iterate `chunks` on a background thread, buffering up to `maxsize` items
+    ahead, so producing them (network reads) overlaps with consuming them
+    (CSV parsing). Errors raised by the producer are re-raised to the consumer.
+    """
+    q = queue.Queue(maxsize)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except Exception as e:
+            put(e)
+        else:
+            put(done)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = q.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Lets the producer exit if the consumer stops early
+        stop.set()
+
+
+def _first_csv_name(zf: zipfile.ZipFile) -> str:
+    """Return the name of the first CSV member in a ZIP archive."""
+    csv_files = [name for name in zf.namelist() if name.lower().endswith(".csv")]
+    if not csv_files:
+        raise RuntimeError("No CSV found inside ZIP.")
+    return csv_files[0]
+
+
+def _sniff_header(csv_file):
+    """
+    Read the header line of a binary CSV file object.
+
+    Returns:
+        tuple: (column names, bytes read from the file so far)
+    """
+    head = b""
+    while b"\n" not in head:
+        block = csv_file.read(64 * 1024)
+        if not block:
+            break
+        head += block
+    header = head.split(b"\n", 1)[0].decode("utf-8-sig").rstrip("\r")
+    return next(csv.reader([header])), head
+
+
+def _read_csv_arrow(csv_file, columns: Optional[List[str]] = None):
+    """
+    Read a binary CSV file object into a pyarrow Table, keeping every column
+    as a string (like dtype="str") so codes with leading zeros survive.
+    """
+    _require_pyarrow()
+    names, head = _sniff_header(csv_file)
+    if csv_file.seekable():
+        csv_file.seek(0)
+    else:
+        # Replay the sniffed header in front of the rest of the stream
+        source = csv_file
+        csv_file = _ChunkReader(
+            itertools.chain([head], iter(lambda: source.read(1024 * 1024), b""))
+        )
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in names},
+        include_columns=columns,
+        strings_can_be_null=True,
+    )
+    return pa_csv.read_csv(csv_file, convert_options=convert_options)
+
+
+def _read_csv(
+    csv_file,
+    columns: Optional[List[str]] = None,
+    use_arrow: bool = False,
+    as_arrow: bool = False,
+):
+    """
+    Read a CSV into a DataFrame of strings. With use_arrow=True the CSV is
+    parsed by pyarrow and the strings stay in Arrow buffers (pd.ArrowDtype)
+    instead of becoming one Python object per cell. With as_arrow=True the
+    pyarrow Table itself is returned.
+    """
+    if use_arrow or as_arrow:
+        table = _read_csv_arrow(csv_file, columns)
+        return table if as_arrow else table.to_pandas(types_mapper=pd.ArrowDtype)
+    # usecols keeps file order; return the requested order like pyarrow does
+    df = pd.read_csv(csv_file, usecols=columns, dtype="str")
+    return df[columns] if columns else df
+
+
 class GoldenCopyDownload:
     """Downloader for GLEIF Golden Copy files."""
 
@@ -17,6 +191,7 @@ class GoldenCopyDownload:
         "xml": ".xml",
     }
     TARGET_DATETIME = re.compile(r"(20\d{6})[-_](\d{4})")  # e.g., 20250813-0800
+    CACHE_INDEX = "cache_index.json"  # url -> saved file name, size, mtime, SHA-256
 
     def __init__(self, page_url, save_dir="./gc_downloads"):
         """
@@ -25,9 +200,22 @@ class GoldenCopyDownload:
             save_dir (str): Folder where downloaded files are stored
         """
         self.page_url = page_url
+        self._base_url = page_url.rstrip("/")
         self.save_dir = save_dir
         os.makedirs(self.save_dir, exist_ok=True)
 
+        # Keep-alive session so consecutive requests to the GLEIF host reuse
+        # the same TCP/TLS connection
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            ),
+        )
+
     @classmethod
     async def download_for_date(cls, date: str, save_dir: str = "./gc_downloads"):
         """
@@ -58,11 +246,11 @@ class GoldenCopyDownload:
         except ValueError:
             return None
 
-    async def find_download_url(
+    def build_download_url(
         self, date_str: str, time_str: str, filetype: str, variant: str
-    ):
+    ) -> str:
         """
-        Search for the matching download link.
+        Build the download URL for a Golden Copy publication.
 
         Args:
             date_str (str): YYYY-MM-DD
@@ -73,29 +261,80 @@ class GoldenCopyDownload:
         Returns:
             str: Download URL
         """
-        filetype = filetype.lower()
-        variant = variant.lower()
-
-        if filetype not in self.EXT_BY_TYPE:
+        want_ext = self.EXT_BY_TYPE.get(filetype.lower())
+        if want_ext is None:
             raise ValueError(
-                f"Invalid filetype '{filetype}'. Choose from: {list(self.EXT_BY_TYPE)}"
+                f"Invalid filetype '{filetype.lower()}'. Choose from: {list(self.EXT_BY_TYPE)}"
             )
 
-        want_ext = self.EXT_BY_TYPE[filetype]
-
         # Build token like 20250922-0000 from date and time (default 00:00)
         normalized_time = time_str if time_str else "00:00"
         dt_obj = datetime.strptime(f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M")
         time_token = dt_obj.strftime("%Y%m%d-%H%M")
 
-        base = self.page_url.rstrip("/")
-        return f"{base}/{variant}/{time_token}{want_ext}"
+        return f"{self._base_url}/{variant.lower()}/{time_token}{want_ext}"
+
+    async def find_download_url(
+        self, date_str: str, time_str: str, filetype: str, variant: str
+    ):
+        """
+        Search for the matching download link.
+        Async wrapper around build_download_url, kept for compatibility.
+
+        Returns:
+            str: Download URL
+        """
+        return self.build_download_url(date_str, time_str, filetype, variant)
+
+    def _load_cache_index(self) -> dict:
+        """Load the download cache index from save_dir (empty if missing)."""
+        index_path = os.path.join(self.save_dir, self.CACHE_INDEX)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache_index(self, index: dict):
+        """Write the download cache index to save_dir."""
+        index_path = os.path.join(self.save_dir, self.CACHE_INDEX)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+
+    def _is_cached_file_unchanged(self, index: dict, url: str) -> bool:
+        """
+        Check the file downloaded for url against its cache index entry.
 
+        Matching size and mtime are trusted as is; the file is only hashed when
+        the mtime differs, and the entry is refreshed if the content still
+        matches.
+        """
+        entry = index[url]
+        path = os.path.join(self.save_dir, entry["file"])
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_size, stat.st_mtime_ns) == (
+            entry.get("size"),
+            entry.get("mtime_ns"),
+        ):
+            return True
+        if entry.get("size") not in (None, stat.st_size):
+            return False
+        if _sha256(path) != entry.get("sha256"):
+            return False
+
+        entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+        self._save_cache_index(index)
+        return True
 
     def download_file(self, url: str):
         """
         Download a file from URL to save_dir, using server filename if provided.
-        If file already exists, skip download.
+        If the file was already downloaded and is unchanged since (same size and
+        mtime as in the cache index, or else the same SHA-256), or it exists
+        without an index entry, skip download.
 
         Returns:
             str: Path to the file
@@ -105,12 +344,20 @@ class GoldenCopyDownload:
         )
         save_path = os.path.join(self.save_dir, filename)
 
-        # Skip if already exists
-        if os.path.exists(save_path):
+        # Skip if already downloaded and unchanged since
+        index = self._load_cache_index()
+        entry = index.get(url)
+        if entry:
+            cached_path = os.path.join(self.save_dir, entry["file"])
+            if self._is_cached_file_unchanged(index, url):
+                print(f"File already exists, skipping download: {cached_path}")
+                return os.path.abspath(cached_path)
+            print(f"Cached file missing or changed, downloading again: {cached_path}")
+        elif os.path.exists(save_path):
             print(f"File already exists, skipping download: {save_path}")
             return os.path.abspath(save_path)
 
-        with requests.get(url, stream=True, timeout=120) as r:
+        with self.session.get(url, stream=True, timeout=120) as r:
             r.raise_for_status()
             cd = r.headers.get("Content-Disposition", "")
             match = re.search(r'filename="?([^"]+)"?', cd, re.I)
@@ -118,10 +365,22 @@ class GoldenCopyDownload:
                 filename = match.group(1)
                 save_path = os.path.join(self.save_dir, filename)
 
+            # Hash while writing so the index entry costs no extra read
+            digest = hashlib.sha256()
             with open(save_path, "wb") as f:
                 for chunk in r.iter_content(1024 * 1024):
                     if chunk:
                         f.write(chunk)
+                        digest.update(chunk)
+
+        stat = os.stat(save_path)
+        index[url] = {
+            "file": filename,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest.hexdigest(),
+        }
+        self._save_cache_index(index)
 
         print(f"Downloaded file: {save_path}")
         return os.path.abspath(save_path)
@@ -133,7 +392,7 @@ class GoldenCopyDownload:
         """
         try:
             # Try to get available file
-            url = await self.find_download_url(date, "00:00", "csv", "lei2")
+            url = self.build_download_url(date, "00:00", "csv", "lei2")
             print(url)
             print("Found URL for:", url)
 
@@ -146,19 +405,25 @@ class GoldenCopyDownload:
             print(f"Failed to download file for date {date}: {e}")
             return None
 
-    def unzip_and_read_csv(zip_path, extract_dir="./gc_downloads", chunksize=None):
+    def unzip_and_read_csv(
+        zip_path,
+        extract_dir="./gc_downloads",
+        chunksize=None,
+        columns=None,
+        use_arrow=False,
+        as_arrow=False,
+    ):
         """
         Unzips the first CSV in the ZIP file and reads it into a DataFrame.
         If chunksize is provided, returns an iterator over DataFrame chunks.
+        If columns is provided, only those columns are parsed; names missing
+        from the CSV header are reported and skipped.
+        If use_arrow is True, strings are stored as pyarrow-backed columns.
+        If as_arrow is True (and no chunksize), returns a pyarrow Table instead.
         """
         # Find CSV inside ZIP
         with zipfile.ZipFile(zip_path, "r") as zf:
-            csv_files = [
-                name for name in zf.namelist() if name.lower().endswith(".csv")
-            ]
-            if not csv_files:
-                raise RuntimeError("No CSV found inside ZIP.")
-            csv_name = csv_files[0]
+            csv_name = _first_csv_name(zf)
             csv_path = os.path.join(extract_dir, os.path.basename(csv_name))
 
             # Extract only if not already present
@@ -170,95 +435,196 @@ class GoldenCopyDownload:
                 if extracted_path != csv_path and os.path.exists(extracted_path):
                     os.rename(extracted_path, csv_path)
 
+        # Check requested columns against the header so that only those
+        # columns are parsed, instead of reading everything and subsetting
+        if columns:
+            with open(csv_path, "rb") as csv_file:
+                header, _ = _sniff_header(csv_file)
+            missing_columns = [col for col in columns if col not in header]
+            if missing_columns:
+                print(f"Warning: Some columns not found: {missing_columns}")
+            columns = [col for col in columns if col in header]
+
+            # None of the requested columns exist: return the rows with no
+            # columns. An empty column list means "all columns" to pyarrow and
+            # "no rows" to pandas, so parse just the first column and drop it
+            if not columns:
+                rows = GoldenCopyDownload.unzip_and_read_csv(
+                    zip_path,
+                    extract_dir,
+                    chunksize=chunksize,
+                    columns=header[:1],
+                    use_arrow=use_arrow,
+                    as_arrow=as_arrow,
+                )
+                if chunksize:
+                    return (chunk[[]] for chunk in rows)
+                return rows.select([]) if as_arrow else rows[[]]
+
         # Read CSV
         if chunksize:
-            return pd.read_csv(csv_path, chunksize=chunksize, dtype="str")
+            if use_arrow:
+                _require_pyarrow()
+                return pd.read_csv(
+                    csv_path,
+                    usecols=columns,
+                    chunksize=chunksize,
+                    dtype=pd.ArrowDtype(pa.string()),
+                )
+            return pd.read_csv(
+                csv_path, usecols=columns, chunksize=chunksize, dtype="str"
+            )
         else:
-            return pd.read_csv(csv_path, dtype="str")
-
-    def download_and_read_csv_in_memory(self, url: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+            # Memory-map the extracted CSV so it is parsed straight from the
+            # page cache instead of being copied through read() buffers
+            if use_arrow or as_arrow:
+                _require_pyarrow()
+                with pa.memory_map(csv_path, "r") as csv_file:
+                    return _read_csv(
+                        csv_file, columns, use_arrow=True, as_arrow=as_arrow
+                    )
+            df = pd.read_csv(csv_path, usecols=columns, dtype="str", memory_map=True)
+            return df[columns] if columns else df
+
+    def download_and_read_csv_in_memory(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        use_arrow: bool = False,
+        as_arrow: bool = False,
+    ) -> pd.DataFrame:
         """
         Download CSV from URL and read it directly into memory without saving to disk.
         
         Args:
             url: URL to download the CSV from
             columns: Optional list of column names to read. If None, reads all columns.
+            use_arrow: If True, parse with pyarrow and keep strings in Arrow buffers
+            as_arrow: If True, return the parsed pyarrow Table instead of a DataFrame
             
         Returns:
             pandas.DataFrame: The CSV data
         """
         print(f"Downloading CSV directly to memory from: {url}")
         
-        with requests.get(url, stream=True, timeout=120) as r:
+        with self.session.get(url, stream=True, timeout=120) as r:
             r.raise_for_status()
             
-            # Read the response content
-            content = r.content
-            
-            # Create a BytesIO object to read the CSV
-            csv_buffer = io.BytesIO(content)
+            # Parse while the body is still downloading: a background thread
+            # pulls 1 MiB chunks off the socket and the parser reads them
+            chunks = _prefetch(r.iter_content(1024 * 1024))
             
             # Read CSV with optional column selection
             if columns:
                 print(f"Reading only selected columns: {len(columns)} columns")
-                df = pd.read_csv(csv_buffer, usecols=columns, dtype="str")
             else:
                 print("Reading all columns")
-                df = pd.read_csv(csv_buffer, dtype="str")
+            try:
+                df = _read_csv(_ChunkReader(chunks), columns, use_arrow, as_arrow)
+            finally:
+                chunks.close()
                 
         print(f"Successfully loaded {len(df):,} rows and {len(df.columns)} columns into memory")
         return df
 
-    def download_zip_and_read_csv_in_memory(self, url: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def download_zip_and_read_csv_in_memory(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        use_arrow: bool = False,
+        as_arrow: bool = False,
+    ) -> pd.DataFrame:
         """
         Download ZIP file and read CSV directly into memory without saving to disk.
         
         Args:
             url: URL to download the ZIP file from
             columns: Optional list of column names to read. If None, reads all columns.
+            use_arrow: If True, parse with pyarrow and keep strings in Arrow buffers
+            as_arrow: If True, return the parsed pyarrow Table instead of a DataFrame
             
         Returns:
             pandas.DataFrame: The CSV data from the ZIP file
         """
         print(f"Downloading ZIP file directly to memory from: {url}")
         
-        with requests.get(url, stream=True, timeout=120) as r:
-            r.raise_for_status()
-            
-            # Read the response content
-            zip_content = r.content
-            
-            # Create a BytesIO object to read the ZIP
-            zip_buffer = io.BytesIO(zip_content)
-            
+        with self._spool_download(url) as zip_buffer:
             # Find CSV inside ZIP
             with zipfile.ZipFile(zip_buffer, "r") as zf:
-                csv_files = [
-                    name for name in zf.namelist() if name.lower().endswith(".csv")
-                ]
-                if not csv_files:
-                    raise RuntimeError("No CSV found inside ZIP.")
-                csv_name = csv_files[0]
+                csv_name = _first_csv_name(zf)
                 
                 # Read CSV from ZIP
                 with zf.open(csv_name) as csv_file:
                     if columns:
                         print(f"Reading only selected columns: {len(columns)} columns")
-                        df = pd.read_csv(csv_file, usecols=columns, dtype="str")
                     else:
                         print("Reading all columns")
-                        df = pd.read_csv(csv_file, dtype="str")
+                    df = _read_csv(csv_file, columns, use_arrow, as_arrow)
                         
         print(f"Successfully loaded {len(df):,} rows and {len(df.columns)} columns into memory")
         return df
 
+    def iter_csv_chunks(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        chunksize: int = 200_000,
+        use_arrow: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Download a ZIP file and yield the CSV inside it as DataFrames of at most
+        `chunksize` rows, so peak memory depends on the chunk size rather than
+        on the size of the file.
+
+        Args:
+            url: URL to download the ZIP file from
+            columns: Optional list of column names to read. If None, reads all columns.
+            chunksize: Number of rows per yielded DataFrame
+            use_arrow: If True, keep strings in pyarrow-backed columns
+
+        Yields:
+            pandas.DataFrame: Consecutive chunks of the CSV data
+        """
+        if use_arrow:
+            _require_pyarrow()
+        dtype = pd.ArrowDtype(pa.string()) if use_arrow else "str"
+
+        print(f"Streaming CSV chunks of {chunksize:,} rows from: {url}")
+        with self._spool_download(url) as zip_buffer:
+            with zipfile.ZipFile(zip_buffer, "r") as zf:
+                with zf.open(_first_csv_name(zf)) as csv_file:
+                    yield from pd.read_csv(
+                        csv_file, usecols=columns, chunksize=chunksize, dtype=dtype
+                    )
+
+    def _spool_download(self, url: str):
+        """
+        Stream the response body into a spooled temp file and return it rewound.
+        Small files stay in RAM; large ones roll over to disk instead of being
+        held in memory as one bytes object. The caller must close the file.
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+        try:
+            with self.session.get(url, stream=True, timeout=120) as r:
+                r.raise_for_status()
+                for chunk in r.iter_content(1024 * 1024):
+                    if chunk:
+                        spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
+
     @classmethod
     async def download_for_date_in_memory(
         cls, 
         date: str, 
         save_dir: str = "./gc_downloads",
         columns: Optional[List[str]] = None,
-        keep_in_memory: bool = False
+        keep_in_memory: bool = False,
+        use_arrow: bool = False,
+        as_arrow: bool = False
     ) -> Union[str, pd.DataFrame]:
         """
         Enhanced class method to download GLEIF Golden Copy for a specific date.
@@ -269,6 +635,8 @@ class GoldenCopyDownload:
             save_dir: Directory to save the downloaded file (ignored if keep_in_memory=True)
             columns: Optional list of column names to read. If None, reads all columns.
             keep_in_memory: If True, returns DataFrame directly. If False, returns file path.
+            use_arrow: If True, keep strings in pyarrow-backed columns (in-memory only)
+            as_arrow: If True, return a pyarrow Table instead of a DataFrame (in-memory only)
             
         Returns:
             str: Path to downloaded file (if keep_in_memory=False)
@@ -280,28 +648,40 @@ class GoldenCopyDownload:
         )
         
         if keep_in_memory:
-            return await downloader.prepare_download_in_memory(date, columns)
+            return await downloader.prepare_download_in_memory(
+                date, columns, use_arrow, as_arrow
+            )
         else:
             return await downloader.prepare_download(date)
 
-    async def prepare_download_in_memory(self, date: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    async def prepare_download_in_memory(
+        self,
+        date: str,
+        columns: Optional[List[str]] = None,
+        use_arrow: bool = False,
+        as_arrow: bool = False,
+    ) -> pd.DataFrame:
         """
         Prepare the downloader for the given date and return data in memory.
         
         Args:
             date: Date in YYYY-MM-DD format
             columns: Optional list of column names to read
+            use_arrow: If True, keep strings in pyarrow-backed columns
+            as_arrow: If True, return a pyarrow Table instead of a DataFrame
             
         Returns:
             pd.DataFrame: The CSV data
         """
         try:
             # Try to get available file
-            url = await self.find_download_url(date, "00:00", "csv", "lei2")
+            url = self.build_download_url(date, "00:00", "csv", "lei2")
             print(f"Found URL for: {url}")
             
             # Download and read directly into memory
-            df = self.download_zip_and_read_csv_in_memory(url, columns)
+            df = self.download_zip_and_read_csv_in_memory(
+                url, columns, use_arrow, as_arrow
+            )
             print("Data loaded successfully into memory")
             return df
             
@@ -316,7 +696,9 @@ class GoldenCopyDownload:
         save_to_disk: bool = True,
         use_full_dataset: bool = True,
         essential_columns: Optional[List[str]] = None,
-        save_dir: str = "./gc_downloads"
+        save_dir: str = "./gc_downloads",
+        use_arrow: bool = False,
+        as_arrow: bool = False
     ) -> pd.DataFrame:
         """
         Download GLEIF Golden Copy data with configuration options.
@@ -327,9 +709,13 @@ class GoldenCopyDownload:
             use_full_dataset: If True, use all columns; if False, use only essential_columns
             essential_columns: List of column names to use when use_full_dataset=False
             save_dir: Directory to save files (ignored if save_to_disk=False)
+            use_arrow: If True, parse with pyarrow and keep strings in Arrow-backed
+                columns, which uses far less memory (requires pyarrow)
+            as_arrow: If True, return a pyarrow Table instead of a DataFrame; it can
+                be shared with other processes via save_arrow_ipc/load_arrow_ipc
             
         Returns:
-            pd.DataFrame: The loaded data
+            pd.DataFrame: The loaded data (pyarrow.Table if as_arrow=True)
         """
         print(f"Downloading data for date: {date}")
         
@@ -340,13 +726,17 @@ class GoldenCopyDownload:
                 level_1_data = await cls.download_for_date_in_memory(
                     date, 
                     columns=essential_columns, 
-                    keep_in_memory=True
+                    keep_in_memory=True,
+                    use_arrow=use_arrow,
+                    as_arrow=as_arrow
                 )
             else:
                 print("Using full dataset - Download may take a while")
                 level_1_data = await cls.download_for_date_in_memory(
                     date, 
-                    keep_in_memory=True
+                    keep_in_memory=True,
+                    use_arrow=use_arrow,
+                    as_arrow=as_arrow
                 )
             print(f"Data loaded in memory: {level_1_data.shape[0]:,} rows × {level_1_data.shape[1]} columns")
             
@@ -357,21 +747,49 @@ class GoldenCopyDownload:
             # Read from disk with optional column selection
             if not use_full_dataset and essential_columns:
                 print(f"Reading subset of {len(essential_columns)} columns from disk")
-                level_1_data = cls.unzip_and_read_csv(file_path)
-                # Filter columns after reading
-                available_columns = [col for col in essential_columns if col in level_1_data.columns]
-                missing_columns = [col for col in essential_columns if col not in level_1_data.columns]
-                
-                if missing_columns:
-                    print(f"Warning: Some columns not found: {missing_columns}")
-                
-                level_1_data = level_1_data[available_columns]
+                level_1_data = cls.unzip_and_read_csv(
+                    file_path,
+                    columns=essential_columns,
+                    use_arrow=use_arrow,
+                    as_arrow=as_arrow,
+                )
                 print(f"Data loaded from disk: {level_1_data.shape[0]:,} rows × {level_1_data.shape[1]} columns")
             else:
                 print("Reading full dataset from disk")
-                level_1_data = cls.unzip_and_read_csv(file_path)
+                level_1_data = cls.unzip_and_read_csv(
+                    file_path, use_arrow=use_arrow, as_arrow=as_arrow
+                )
                 print(f"Data loaded from disk: {level_1_data.shape[0]:,} rows × {level_1_data.shape[1]} columns")
 
-        print(f"Memory usage: {level_1_data.memory_usage(deep=True).sum() / 1024**2:.1f} MB")
+        if as_arrow:
+            memory_usage = level_1_data.nbytes
+        else:
+            memory_usage = level_1_data.memory_usage(deep=True).sum()
+        print(f"Memory usage: {memory_usage / 1024**2:.1f} MB")
         
-        return level_1_data
\ No newline at end of file
+        return level_1_data
+
+    @staticmethod
+    def save_arrow_ipc(table, path: str) -> str:
+        """
+        Write a pyarrow Table to an Arrow IPC file so other processes can open it
+        with load_arrow_ipc without deserializing or copying it.
+
+        Returns:
+            str: Path to the written file
+        """
+        _require_pyarrow()
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return os.path.abspath(path)
+
+    @staticmethod
+    def load_arrow_ipc(path: str):
+        """
+        Open an Arrow IPC file written by save_arrow_ipc. The file is memory-mapped,
+        so the returned Table references the page cache instead of copying it.
+        """
+        _require_pyarrow()
+        with pa.memory_map(path, "r") as source:
+            return pa.ipc.open_file(source).read_all()
\ No newline at end of file
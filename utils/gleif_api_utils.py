@@ -1,6 +1,13 @@
-import time
+import asyncio
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Iterable, List
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional, only needed for fetch_lei_attrs_many
+    aiohttp = None
 
 
 class GLEIFAPI:
@@ -10,6 +17,7 @@ class GLEIFAPI:
     - Reuses a single HTTP session
     - Exponential backoff on transient errors
     - Convenience methods for LEI attributes and ISINs (with pagination)
+    - Concurrent batch lookup of LEI attributes (requires aiohttp)
     - Helper to build summary and long-form DataFrames
     """
 
@@ -27,30 +35,40 @@ class GLEIFAPI:
         self.retries = retries
         self.backoff = backoff
         self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=retries,
+                    backoff_factor=backoff,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+            ),
+        )
 
     def _get(self, path_or_url: str, params: Optional[Dict[str, Any]] = None):
         """
-        GET with basic retries/backoff. Accepts either a full URL or a path.
+        GET with retries/backoff on transient errors (handled by the session's
+        retry adapter). Accepts either a full URL or a path.
+
+        Raises:
+            RuntimeError: if the final response is not 200 OK
         """
         url = (
             path_or_url
             if path_or_url.startswith("http")
             else f"{self.base_url}/{path_or_url.lstrip('/')}"
         )
-        for i in range(self.retries):
-            resp = self.session.get(
-                url, headers=self.headers, params=params, timeout=self.timeout
-            )
-            if resp.status_code == 200:
-                return resp.json()
-            else:
-                time.sleep(self.backoff ** (i + 1))
-                continue
+        resp = self.session.get(
+            url, headers=self.headers, params=params, timeout=self.timeout
+        )
+        if resp.status_code != 200:
             raise RuntimeError(
                 f"GET {url} failed ({resp.status_code}): {resp.text[:300]}"
             )
-
-        return {}
+        return resp.json()
 
     def fetch_lei_attrs(self, lei: str):
         """
@@ -58,3 +76,43 @@ class GLEIFAPI:
         """
         payload = self._get(f"lei-records/{lei}")
         return (payload.get("data") or {}).get("attributes", {}) or {}
+
+    async def fetch_lei_attrs_many(
+        self, leis: Iterable[str], concurrency: int = 32
+    ) -> List[Any]:
+        """
+        Return the attributes blocks for many LEI records, fetching up to
+        `concurrency` of them at a time over a pooled keep-alive connection.
+
+        Results are in the same order as `leis`. A lookup that fails is returned
+        as its exception instead of aborting the whole batch. Unlike _get, no
+        retries are attempted.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "fetch_lei_attrs_many requires the optional 'aiohttp' package"
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(
+            headers=self.headers, connector=connector, timeout=timeout
+        ) as session:
+
+            async def fetch_one(lei: str):
+                url = f"{self.base_url}/lei-records/{lei}"
+                async with semaphore, session.get(url) as resp:
+                    if resp.status != 200:
+                        text = await resp.text()
+                        raise RuntimeError(
+                            f"GET {url} failed ({resp.status}): {text[:300]}"
+                        )
+                    # JSON:API responses use application/vnd.api+json
+                    payload = await resp.json(content_type=None)
+                return (payload.get("data") or {}).get("attributes", {}) or {}
+
+            return await asyncio.gather(
+                *(fetch_one(lei) for lei in leis), return_exceptions=True
+            )
@@ -1,8 +1,59 @@
+import os
+from typing import Union
+
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Render off-screen (no GUI event loop) in headless batch runs; this has to
+# happen before pyplot is imported
+if os.environ.get("GLEIF_HEADLESS"):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.container import BarContainer
 from matplotlib.patches import Circle
-import math
+
+
+def _find_jurisdiction_col(df: pd.DataFrame) -> str:
+    """
+    Find the LegalJurisdiction column of a level 1 frame.
+
+    The column name is remembered in df.attrs, so later calls on the same frame
+    (or frames derived from it that still have the column) skip the scan.
+
+    Args:
+        df: Level 1 data
+
+    Returns:
+        Name of the first column containing "LegalJurisdiction"
+    """
+    key = "_lei_juris_col"
+    cached = df.attrs.get(key)
+    if cached is not None and cached in df.columns:
+        return cached
+
+    for col in df.columns:
+        if "LegalJurisdiction" in col:
+            df.attrs[key] = col
+            return col
+
+    raise ValueError("No LegalJurisdiction column found in level_1_subset")
+
+
+def _build_lei_lookup(level_1_subset: pd.DataFrame) -> pd.Series:
+    """
+    Build the LEI -> legal jurisdiction lookup for a level 1 frame.
+
+    Args:
+        level_1_subset: Level 1 data with an LEI column and a LegalJurisdiction column
+
+    Returns:
+        Series of legal jurisdictions indexed by LEI
+    """
+    jurisdiction_col = _find_jurisdiction_col(level_1_subset)
+    return level_1_subset.drop_duplicates("LEI").set_index("LEI")[jurisdiction_col]
 
 
 class Visualizations:
@@ -12,45 +63,45 @@ class Visualizations:
     - Creates a stacked bar chart using matplotlib for better control over stacking.
     """
 
-    def create_matplotlib_stacked_chart(by_mapping, level_1_subset, top_n=5):
+    @staticmethod
+    def create_matplotlib_stacked_chart(
+        by_mapping, level_1_subset, top_n=5, show: bool = True
+    ):
         """
         Create a stacked bar chart using matplotlib for better control over stacking.
+
+        Args:
+            by_mapping: Mapping name -> DataFrame of mapping pairs with an LEI column
+            level_1_subset: Level 1 data with an LEI column and a LegalJurisdiction
+                column
+            top_n: Number of jurisdictions to show
+            show: Call plt.show() once the chart is drawn; pass False to keep the
+                figure open (e.g. to save it via plt.gcf() in a headless batch run)
+
+        Returns:
+            Tuple of (data matrix, jurisdiction names, mapping labels)
         """
 
-        # Find the jurisdiction column name
-        jurisdiction_col = None
-        for col in level_1_subset.columns:
-            if "LegalJurisdiction" in col:
-                jurisdiction_col = col
-                break
-
-        if jurisdiction_col is None:
-            raise ValueError("No LegalJurisdiction column found in level_1_subset")
-
-        # Get top N jurisdictions by total mapping pairs
-        jurisdiction_counts = {}
-
-        # Merge each mapping with level_1 data and count by jurisdiction
-        for mapping_name, mapping_df in by_mapping.items():
-            merged = pd.merge(level_1_subset, mapping_df, on="LEI", how="inner")
-            jurisdiction_counts[mapping_name] = merged[jurisdiction_col].value_counts()
-
-        # Get top N jurisdictions
-        all_jurisdictions = set()
-        for counts in jurisdiction_counts.values():
-            all_jurisdictions.update(counts.index)
-
-        total_counts = {}
-        for jurisdiction in all_jurisdictions:
-            total = sum(
-                counts.get(jurisdiction, 0) for counts in jurisdiction_counts.values()
+        # Count each mapping's LEIs by jurisdiction through one shared
+        # LEI -> jurisdiction lookup (instead of one full merge per mapping)
+        lei_to_jurisdiction = _build_lei_lookup(level_1_subset)
+        jurisdiction_counts = {
+            mapping_name: mapping_df["LEI"]
+            .map(lei_to_jurisdiction)
+            .value_counts(sort=False)
+            for mapping_name, mapping_df in by_mapping.items()
+        }
+
+        # Align the counts into a jurisdictions x mappings table (pd.concat
+        # builds the union of jurisdictions) and get the top N jurisdictions by
+        # total mapping pairs (the only ordering needed)
+        if jurisdiction_counts:
+            counts_df = (
+                pd.concat(jurisdiction_counts, axis=1).fillna(0).astype(np.int64)
             )
-            total_counts[jurisdiction] = total
-
-        top_jurisdictions = sorted(
-            total_counts.items(), key=lambda x: x[1], reverse=True
-        )[:top_n]
-        top_jurisdiction_names = [j[0] for j in top_jurisdictions]
+        else:
+            counts_df = pd.DataFrame(index=[], columns=[], dtype=np.int64)
+        top_jurisdiction_names = counts_df.sum(axis=1).nlargest(top_n).index.tolist()
 
         # Prepare data for stacking
         mapping_types = list(by_mapping.keys())
@@ -58,16 +109,11 @@ class Visualizations:
             mapping.replace("-lei", "").upper() for mapping in mapping_types
         ]
 
-        # Create data matrix for stacking
-        data_matrix = []
-        for jurisdiction in top_jurisdiction_names:
-            row = []
-            for mapping_name in mapping_types:
-                count = jurisdiction_counts[mapping_name].get(jurisdiction, 0)
-                row.append(count)
-            data_matrix.append(row)
-
-        data_matrix = np.array(data_matrix)
+        # Create data matrix for stacking; per-jurisdiction counts of mapping
+        # pairs fit comfortably in int32
+        data_matrix = counts_df.loc[top_jurisdiction_names, mapping_types].to_numpy(
+            dtype=np.int32
+        )
 
         # Create the plot with wider figure to accommodate wider bars
         fig, ax = plt.subplots(figsize=(14, 8))
@@ -75,45 +121,58 @@ class Visualizations:
         # Use turquoise color scheme consistent with existing visualizations
         colors = ["#123235", "#79D7C5", "#403E74", "#4D979B", "#4DA2F8"]
 
-        # Create stacked bars
-        bottom = np.zeros(len(top_jurisdiction_names))
+        # Create stacked bars at numeric x positions, labelled once below
+        x_pos = np.arange(len(top_jurisdiction_names))
         bar_width = 0.7
 
+        # Each segment starts where the previous mapping types ended
+        cum = np.cumsum(data_matrix, axis=1)
+
+        # Segments above 3% of the largest value get a label, drawn in white
+        # above 8%
+        dm_max = float(data_matrix.max()) if data_matrix.size else 0.0
+        sig = (data_matrix > 0) & (data_matrix > dm_max * 0.03)
+        white = data_matrix > dm_max * 0.08
+
         for i, (mapping_type, label) in enumerate(zip(mapping_types, mapping_labels)):
             values = data_matrix[:, i]
-            ax.bar(
-                top_jurisdiction_names,
+
+            # Mapping types with no pairs in any top jurisdiction would only
+            # add zero-height patches
+            if not values.any():
+                continue
+
+            bars = ax.bar(
+                x_pos,
                 values,
-                bottom=bottom,
+                bottom=cum[:, i - 1] if i else 0,
                 label=label,
                 color=colors[i % len(colors)],
                 alpha=1.0,
                 width=bar_width,
             )
 
-            # Add value labels on significant segments
-            for j, (jurisdiction, value) in enumerate(
-                zip(top_jurisdiction_names, values)
+            # Add value labels on significant segments only, centred by
+            # bar_label; one call per text colour
+            for mask, text_color in (
+                (sig[:, i] & white[:, i], "white"),
+                (sig[:, i] & ~white[:, i], "black"),
             ):
-                if (
-                    value > 0 and value > max(data_matrix.flatten()) * 0.03
-                ):  # Only show significant values
-                    label_y = bottom[j] + value / 2
-                    ax.text(
-                        j,
-                        label_y,
-                        f"{value:,}",
-                        ha="center",
-                        va="center",
+                idx = np.flatnonzero(mask)
+                if idx.size:
+                    ax.bar_label(
+                        BarContainer(
+                            [bars[j] for j in idx],
+                            datavalues=values[idx],
+                            orientation="vertical",
+                        ),
+                        labels=[f"{v:,}" for v in values[idx]],
+                        label_type="center",
                         fontsize=9,
                         fontweight="bold",
-                        color="white"
-                        if value > max(data_matrix.flatten()) * 0.08
-                        else "black",
+                        color=text_color,
                     )
 
-            bottom += values
-
         # Customize the plot
         ax.set_title(
             "Distribution of Mapping Pairs by Jurisdiction and Mapping Type",
@@ -124,8 +183,9 @@ class Visualizations:
         ax.set_xlabel("Legal Jurisdiction", fontsize=12, fontweight="bold")
         ax.set_ylabel("Number of Mapping Pairs", fontsize=12, fontweight="bold")
 
-        # Rotate x-axis labels
-        plt.xticks(rotation=45, ha="right")
+        # Label the bars with the jurisdictions, rotated
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(top_jurisdiction_names, rotation=45, ha="right")
 
         # Add some padding to prevent labels from touching borders
         ax.margins(x=0.05, y=0.05)
@@ -149,43 +209,72 @@ class Visualizations:
 
         # Use tight_layout with padding to ensure proper spacing
         plt.tight_layout(pad=2.0)
-        plt.show()
+        if show:
+            plt.show()
 
-        # Print detailed breakdown
-        print("\nDetailed Breakdown by Jurisdiction:")
-        print("=" * 60)
+        # Print detailed breakdown, built up as one string and printed once
+        row_totals = data_matrix.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percentages = data_matrix / row_totals[:, None] * 100
+
+        lines = ["\nDetailed Breakdown by Jurisdiction:", "=" * 60]
         for i, jurisdiction in enumerate(top_jurisdiction_names):
-            print(f"\n{jurisdiction}:")
-            total_for_jurisdiction = 0
-            for j, (mapping_type, label) in enumerate(
-                zip(mapping_types, mapping_labels)
-            ):
+            lines.append(f"\n{jurisdiction}:")
+            for j, label in enumerate(mapping_labels):
                 count = data_matrix[i, j]
                 if count > 0:
-                    percentage = (count / sum(data_matrix[i, :])) * 100
-                    print(f"  {label}: {count:,} ({percentage:.1f}%)")
-                    total_for_jurisdiction += count
-            print(f"  Total: {total_for_jurisdiction:,}")
+                    lines.append(f"  {label}: {count:,} ({percentages[i, j]:.1f}%)")
+            lines.append(f"  Total: {row_totals[i]:,}")
+        print("\n".join(lines))
 
         return data_matrix, top_jurisdiction_names, mapping_labels
 
-    def draw_bar_chart_jurisdictions(top20: list[tuple[str, int]], mapping_pairs: str):
+    @staticmethod
+    def draw_bar_chart_jurisdictions(
+        top20: Union[pd.Series, list[tuple[str, int]]],
+        mapping_pairs: str,
+        show: bool = True,
+    ):
+        """
+        Draw a bar chart of mapping pairs per legal jurisdiction.
+
+        Args:
+            top20: Counts per jurisdiction, as a Series (e.g. from value_counts)
+                or a list of (jurisdiction, count) tuples.
+            mapping_pairs: Name of the mapping, used in the title.
+            show: Call plt.show() once the chart is drawn.
+
+        Returns:
+            The matplotlib Figure when show is False, otherwise None (so a
+            notebook cell does not display the chart twice)
+        """
+        if isinstance(top20, pd.Series):
+            top20 = top20.items()
+        labels, values = zip(*top20)
+
         # Plot bar chart
-        plt.figure(figsize=(6, 4))
-        ax = top20.plot(kind="bar", color="Turquoise")
-        plt.title(f"Top 20 Legal Jurisdictions for {mapping_pairs}")
-        plt.xlabel("Legal Jurisdiction")
-        plt.ylabel("Number of mapping pairs")
-        plt.xticks(rotation=45)
+        fig, ax = plt.subplots(figsize=(6, 4))
+        ax.bar([str(label) for label in labels], values, color="Turquoise")
+        ax.set_title(f"Top 20 Legal Jurisdictions for {mapping_pairs}")
+        ax.set_xlabel("Legal Jurisdiction")
+        ax.set_ylabel("Number of mapping pairs")
+        ax.tick_params(axis="x", labelrotation=45)
 
         # Format y-axis labels with thousand separators
         ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"{x:,.0f}"))
 
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        if show:
+            plt.show()
+            return None
+        return fig
 
+    @staticmethod
     def draw_star_map(
-        center_label: str, center_value: int, data: list[tuple[str, int]]
+        center_label: str,
+        center_value: int,
+        data: list[tuple[str, int]],
+        show: bool = True,
     ):
         """
         Draw a simple hub-and-spoke map
@@ -194,6 +283,11 @@ class Visualizations:
             center_label: Text label inside the center circle.
             center_value: Number inside the center circle.
             data: - a list of (label, value) tuples.
+            show: Call plt.show() once the map is drawn.
+
+        Returns:
+            The matplotlib Figure when show is False, otherwise None (so a
+            notebook cell does not display the map twice)
         """
         leaves = data
 
@@ -247,42 +341,49 @@ class Visualizations:
         )
 
         # --- Outer nodes ---
-        angles = [2 * math.pi * i / n for i in range(n)]
-        for (label, value), theta in zip(leaves, angles):
-            x, y = ring_radius * math.cos(theta), ring_radius * math.sin(theta)
-
-            # Direction vector
-            dx, dy = x, y
-            dist = math.hypot(dx, dy)
-            dxn, dyn = dx / dist, dy / dist
-
-            # Edge-to-edge line
-            x_start, y_start = dxn * center_radius, dyn * center_radius
-            x_end, y_end = x - dxn * leaf_radius, y - dyn * leaf_radius
-            ax.plot(
-                [x_start, x_end],
-                [y_start, y_end],
-                color=line_color,
-                linewidth=1,
-                linestyle="--",
+        # Leaf centers sit on the ring, so the unit direction from the center
+        # to each leaf is just (cos, sin) of its angle
+        theta = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        xs, ys = ring_radius * cos_t, ring_radius * sin_t
+
+        # Edge-to-edge lines
+        x_starts, y_starts = center_radius * cos_t, center_radius * sin_t
+        x_ends, y_ends = xs - leaf_radius * cos_t, ys - leaf_radius * sin_t
+
+        ax.add_collection(
+            LineCollection(
+                np.stack(
+                    [
+                        np.column_stack([x_starts, y_starts]),
+                        np.column_stack([x_ends, y_ends]),
+                    ],
+                    axis=1,
+                ),
+                colors=line_color,
+                linewidths=1,
+                linestyles="--",
             )
+        )
 
-            # Halo
-            ax.add_patch(
-                Circle(
-                    (x, y),
-                    leaf_radius + halo_expand,
-                    facecolor=halo_color,
-                    alpha=0.2,
-                    edgecolor="none",
-                )
+        # Halos and leaf circles, one collection each
+        ax.add_collection(
+            PatchCollection(
+                [Circle((x, y), leaf_radius + halo_expand) for x, y in zip(xs, ys)],
+                facecolor=halo_color,
+                alpha=0.2,
+                edgecolor="none",
             )
-            # Leaf circle
-            ax.add_patch(
-                Circle(
-                    (x, y), leaf_radius, facecolor=leaf_circle_color, edgecolor="none"
-                )
+        )
+        ax.add_collection(
+            PatchCollection(
+                [Circle((x, y), leaf_radius) for x, y in zip(xs, ys)],
+                facecolor=leaf_circle_color,
+                edgecolor="none",
             )
+        )
+
+        for (label, value), x, y in zip(leaves, xs, ys):
             ax.text(x, y, f"{label}\n{value:,}", ha="center", va="center", fontsize=10)
 
         # Adjust limits
@@ -294,4 +395,7 @@ class Visualizations:
             "Existing Mappings to LEI data", fontsize=12, fontweight="bold", pad=20
         )
 
-        plt.show()
+        if show:
+            plt.show()
+            return None
+        return fig